@@ -1,6 +1,6 @@
 import string
 from collections.abc import Iterable
-from functools import reduce
+from functools import lru_cache, reduce
 
 _preset_base = dict(
     lower=string.ascii_lowercase,
@@ -48,6 +48,11 @@ def alphabet_from_preset(preset: Iterable[str]) -> str:
     '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
 
     """
+    return _alphabet_from_preset(tuple(preset))
+
+
+@lru_cache(maxsize=64)
+def _alphabet_from_preset(preset: tuple[str, ...]) -> str:
     raw_names: list[str] = []
 
     for name in preset:
@@ -107,21 +107,21 @@ def pp(
         passphrase_generator = PassphraseGenerator(wordlist=wordlist, rng=rng, delimiter=delimiter)
         result = passphrase_generator.generate(length)
     except AssertionError as error:
-        click.secho(f"ERROR: {error}", fg="red")
-        click.echo("Try again!")
+        _print_error(error)
         return
 
     passphrase = click.style(result.passphrase, bg=RESULT_BG_COLOR)
-
-    click.echo(f"Passphrase: {passphrase}")
-    click.echo(f"Entropy: {result.entropy:.6}")
+    output = f"Passphrase: {passphrase}\nEntropy: {result.entropy:.6}"
 
     if not result.entropy_is_guaranteed:
-        click.secho(
+        warning = click.style(
             "WARNING: Entropy might be slightly lower than estimated. "
             "See https://papass.readthedocs.io/en/stable/usage_cli.html#entropy-guarantee.",
             fg="yellow",
         )
+        output += f"\n{warning}"
+
+    click.echo(output)
 
 
 @click.command()
@@ -190,7 +190,7 @@ def pw(
             alpha += alphabet_from_preset(alpha_preset.split(","))
 
         if alpha_exclude:
-            alpha = "".join(c for c in alpha if c not in alpha_exclude)
+            alpha = alpha.translate(str.maketrans("", "", alpha_exclude))
 
         assert alpha, "No alphabet given. Did you forget --alphabet or alphabet-names?"
 
@@ -198,24 +198,26 @@ def pw(
         password_generator = PasswordGenerator(rng=rng, alphabet=alpha)
         result = password_generator.generate(length)
     except AssertionError as error:
-        click.secho(f"ERROR: {error}", fg="red")
-        click.echo("Try again!")
+        _print_error(error)
         return
 
     password = click.style(result.password, bg=RESULT_BG_COLOR)
-
-    click.echo(f"Password: {password}")
-    click.echo(f"Entropy: {result.entropy:.6}")
+    click.echo(f"Password: {password}\nEntropy: {result.entropy:.6}")
 
 
 def _print_alpha_preset() -> None:
     base = {k: click.style(v, bg=RESULT_BG_COLOR) for k, v in alphabet_preset_base().items()}
     shortcuts = {k: ",".join(v) for k, v in alphabet_preset_shortcuts().items()}
 
-    click.echo("The following names can be used with -p, --alpha-preset:")
-    click.echo("\n".join(f"{name:9}: {alpha}" for name, alpha in base.items()))
+    lines = ["The following names can be used with -p, --alpha-preset:"]
+    lines.extend(f"{name:9}: {alpha}" for name, alpha in base.items())
+
+    lines.append("\nIn addition the following shortcuts can be used:")
+    lines.extend(f"{short:9}: {names}" for short, names in shortcuts.items())
+
+    lines.append("\nExample: -p letters,digits")
+    click.echo("\n".join(lines))
 
-    click.echo("\nIn addition the following shortcuts can be used:")
-    click.echo("\n".join(f"{short:9}: {names}" for short, names in shortcuts.items()))
 
-    click.echo("\nExample: -p letters,digits")
+def _print_error(error: AssertionError) -> None:
+    click.echo(click.style(f"ERROR: {error}", fg="red") + "\nTry again!")
@@ -1,6 +1,5 @@
 import math
 from dataclasses import dataclass
-from functools import cached_property
 
 from .random_source.base import RngBase
 from .utils import PowerSequence
@@ -43,6 +42,8 @@ class PassphraseGenerator:
     _rng: RngBase
 
     _delimiter: str
+    _delimiter_in_words: bool
+    _entropy_per_word: float
 
     def __init__(
         self,
@@ -57,11 +58,14 @@ class PassphraseGenerator:
         :param rng: The randomness source to be used to draw words.
         :param delimiter: At most a single character to be put between the generated words.
         """
+        assert len(wordlist) > 0, "Wordlist must not be empty."
         assert len(delimiter) <= 1, "--delimiter must be single character or empty."
 
         self._wordlist = wordlist
         self._rng = rng
         self._delimiter = delimiter
+        self._delimiter_in_words = delimiter != "" and wordlist.contains_char(delimiter)
+        self._entropy_per_word = math.log2(len(wordlist))
 
     def generate(self, length: int) -> PassphraseResult:
         """Generate a random passphrase.
@@ -83,10 +87,6 @@ class PassphraseGenerator:
             entropy_is_guaranteed=self._entropy_is_guaranteed(length),
         )
 
-    @property
-    def _entropy_per_word(self) -> float:
-        return math.log2(len(self._wordlist))
-
     def _entropy_is_guaranteed(self, count: int) -> bool:
         """Return ``True`` if we can guarantee that the entropy estimate is exact.
 
@@ -110,12 +110,7 @@ class PassphraseGenerator:
         if count <= 1:
             # In this case delimiter is not even used
             return True
-        elif self._delimiter == "" or self._delimiter in self._word_alphabet:
+        elif self._delimiter == "" or self._delimiter_in_words:
             return False
 
         return True
-
-    @cached_property
-    def _word_alphabet(self) -> set[str]:
-        """Set of letters occuring the words."""
-        return set().union(*self._wordlist)
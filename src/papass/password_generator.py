@@ -37,8 +37,9 @@ class PasswordGenerator:
             len(c) == 1 for c in alphabet
         ), "Alphabet must be a list of characters (length 1)."
 
-        self._alphabet = list(sorted(set(alphabet)))
+        self._alphabet = "".join(sorted(set(alphabet)))
         self._rng = rng
+        self._entropy_per_char = math.log2(len(self._alphabet))
 
     def generate(self, length: int) -> PasswordResult:
         """Generate a random password.
@@ -58,11 +59,3 @@ class PasswordGenerator:
             password="".join(characters),
             entropy=length * self._entropy_per_char,
         )
-
-    @property
-    def _base(self) -> int:
-        return len(self._alphabet)
-
-    @property
-    def _entropy_per_char(self) -> float:
-        return math.log2(self._base)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Protocol
 
 from papass.utils import QueryUserForDice, rolls_to_value
@@ -26,7 +27,7 @@ class QueryForDice(Protocol):
         """
 
 
-@dataclass
+@dataclass(frozen=True)
 class DiceFrame:
     """Metadata required to convert dice rolls into integers.
 
@@ -116,10 +117,15 @@ class DiceRng(RngBase):
         )
 
 
+@lru_cache(maxsize=1024)
 def compute_dice_frame(
     *, num_sides: int, upper: int, required_success_probability: float
 ) -> DiceFrame:
-    """Return the dice frame."""
+    """Return the dice frame.
+
+    The result is cached so that generating several passphrases or passwords of the same
+    size and length in one process computes the frame only once.
+    """
     required_num_rolls = 1
     upper_dice = num_sides
     upper_multiple = (upper_dice // upper) * upper
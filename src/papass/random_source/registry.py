@@ -12,11 +12,14 @@ _rng_registry: dict[str, tuple[type[RngBase], dict[str, str]]] = dict(
     dice=(DiceRng, {"num_sides": "dice_sides"}),
 )
 
+# NOTE: dicts are ordered by insertion order.
+_DEFAULT_RANDOMNESS_SOURCE = next(iter(_rng_registry))
+_AVAILABLE_RANDOMNESS_SOURCES_STR = ", ".join(f"'{s}'" for s in _rng_registry)
+
 
 def default_randomness_source() -> str:
     """Return default value for --random-source."""
-    # NOTE: dicts are ordered by insertion order.
-    return list(_rng_registry.keys())[0]
+    return _DEFAULT_RANDOMNESS_SOURCE
 
 
 def available_random_sources() -> list[str]:
@@ -26,7 +29,7 @@ def available_random_sources() -> list[str]:
 
 def available_randomness_sources_str() -> str:
     """Return a string representing all valid values for --random-source."""
-    return ", ".join(f"'{s}'" for s in available_random_sources())
+    return _AVAILABLE_RANDOMNESS_SOURCES_STR
 
 
 def get_rng(random_source: str, **possible_options: Any) -> RngBase:
@@ -1,5 +1,4 @@
 from collections.abc import Iterable, Iterator, Sequence
-from functools import reduce
 from typing import Generic, NoReturn, TypeVar, overload
 
 import click
@@ -15,8 +14,13 @@ def digits_to_value(base: int, digits: Iterable[int]) -> int:
 
     """
     assert base > 1
-    assert all(0 <= d < base for d in digits)
-    return reduce(lambda acc, r: base * acc + r, digits, 0)
+
+    value = 0
+    for d in digits:
+        assert 0 <= d < base
+        value = base * value + d
+
+    return value
 
 
 def rolls_to_value(num_sides: int, rolls: Iterable[int]) -> int:
@@ -28,8 +32,7 @@ def rolls_to_value(num_sides: int, rolls: Iterable[int]) -> int:
     26
 
     """
-    digits = [r - 1 for r in rolls]
-    return digits_to_value(num_sides, digits)
+    return digits_to_value(num_sides, (r - 1 for r in rolls))
 
 
 def value_to_digits(value: int, *, base: int, length: int | None = None) -> list[int]:
@@ -153,6 +156,7 @@ class PowerSequence(Generic[T]):
         self._sequence = sequence
         self._power = power
         self._base_length = len(sequence)
+        self._size: int = self._base_length**power
 
     @property
     def size(self) -> int:
@@ -160,8 +164,7 @@ class PowerSequence(Generic[T]):
 
         NOTE: This replaces __len__. See class docstring for the reason.
         """
-        result: int = self._base_length**self._power
-        return result
+        return self._size
 
     def __bool__(self) -> bool:
         """Return ``True`` iff the sequence is non-empty."""
@@ -183,7 +186,7 @@ class PowerSequence(Generic[T]):
             raise IndexError("Index out of range")
 
         indices = value_to_digits(index, base=self._base_length, length=self._power)
-        return tuple(self._sequence[i] for i in indices)
+        return tuple([self._sequence[i] for i in indices])
 
     def __iter__(self) -> Iterator[tuple[T, ...]]:
         """Iterate over the entire power sequence."""
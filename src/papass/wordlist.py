@@ -1,5 +1,6 @@
 import re
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from functools import cached_property
 from pathlib import Path
 from typing import Any, overload
 
@@ -62,6 +63,10 @@ class WordList(Sequence[str]):
         else:
             return WordList(self._words[index])
 
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the words."""
+        return iter(self._words)
+
     def __len__(self) -> int:
         """Return the number of words."""
         return len(self._words)
@@ -95,7 +100,24 @@ class WordList(Sequence[str]):
     def to_file(self, file_path: Path | str) -> None:
         """Write this wordlist to a file (overwrites if file exists)."""
         with open(file_path, mode="w") as fout:
-            fout.write("\n".join(self))
+            fout.write("\n".join(self._words))
+
+    def contains_char(self, char: str) -> bool:
+        """Return ``True`` iff ``char`` occurs in any of the words.
+
+        Example
+        -------
+        >>> WordList(["foo", "bar"]).contains_char("a")
+        True
+
+        """
+        assert len(char) == 1, "Expected a single character."
+
+        if char == "\n":
+            # Newlines separate the words in ``_text``, so check the words themselves.
+            return any(char in w for w in self._words)
+
+        return char in self._text
 
     @staticmethod
     def from_file(file_path: Path | str, **options: Any) -> "WordList":
@@ -108,8 +130,23 @@ class WordList(Sequence[str]):
         assert file_path.exists(), f"Wordfile does not exist: {file_path}"
 
         with open(file_path) as fin:
-            words = [w.strip("\n") for w in fin.readlines()]
-            return WordList(words, **options)
+            # Text mode already normalizes line endings. Unlike ``str.splitlines`` this
+            # splits on "\n" only:
+            words = fin.read().split("\n")
+
+        if words[-1] == "":
+            # The file ends with a newline.
+            words.pop()
+
+        return WordList(words, **options)
+
+    @cached_property
+    def _text(self) -> str:
+        """All words in one contiguous, newline separated string.
+
+        Scanning this string is much faster than scanning the words one by one.
+        """
+        return "\n".join(self._words)
 
     def _filter_min_word_size(self, min_word_size: int) -> None:
         self._words = [w for w in self._words if len(w) >= min_word_size]
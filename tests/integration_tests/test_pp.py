@@ -138,3 +138,18 @@ def test_remove_leading_digits(tmp_path, opt_remove):
 
         assert result.exit_code == 0
         assert output_pattern.match(result.output)
+
+
+def test_empty_wordlist(tmp_path):
+    runner = CliRunner()
+    wordlist_content = "fo\nfoo"
+    output_pattern = re.compile(r"^ERROR: Wordlist must not be empty\.\nTry again!$")
+
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        with open(WORDLIST_NAME, "w") as f:
+            f.write(wordlist_content)
+
+        result = runner.invoke(cli, ["pp", "-l", "2", "-w", WORDLIST_NAME, "--minw", "4"])
+
+        assert result.exit_code == 0
+        assert output_pattern.match(result.output)
@@ -62,11 +62,23 @@ def test_randbelow(num_sides, upper, rolls):
 
 
 @given(
-    num_sides=st.integers(2, 20),
-    upper=st.integers(2, 1000_000),
-    req_prob_exponent=st.integers(1, 6),
+    cases=st.lists(
+        st.tuples(
+            st.integers(2, 20),  # num_sides
+            st.integers(2, 1000_000),  # upper
+            st.integers(1, 6),  # req_prob_exponent
+        ),
+        min_size=1,
+        max_size=50,
+    )
 )
-def test_compute_frame(num_sides, upper, req_prob_exponent):
+def test_compute_frame(cases):
+    """Check a whole batch of frames per example to cover more cases per hypothesis run."""
+    for num_sides, upper, req_prob_exponent in cases:
+        _check_compute_frame(num_sides, upper, req_prob_exponent)
+
+
+def _check_compute_frame(num_sides: int, upper: int, req_prob_exponent: int) -> None:
     required_success_probability = 1.0 - 10 ** (-req_prob_exponent)
     # Due to possible floating point issues (not sure if really needed)
     epsilon = 10 ** (-2 * req_prob_exponent)
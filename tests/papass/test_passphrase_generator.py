@@ -78,6 +78,10 @@ class TestPassphraseGenerator:
 
         assert ppg.generate(3).passphrase == delimiter.join("aaa")
 
+    def test_empty_wordlist(self):
+        with pytest.raises(AssertionError, match="Wordlist must not be empty."):
+            PassphraseGenerator(wordlist=WordList(), rng=CycleRng([0]))
+
 
 class TestEntropyGuarantee:
     """Test correctness of entropy guarantee.
@@ -20,6 +20,7 @@ from tests.utils.mock import patch_input
 )
 def test_digits_to_value(base, digits, expected):
     assert expected == digits_to_value(base, digits)
+    assert expected == digits_to_value(base, iter(digits)), "Must consume digits only once."
 
 
 @pytest.mark.parametrize(
@@ -40,6 +41,10 @@ def test_rolls_to_value(num_sides, rolls):
     [
         (123, 10, 4, [0, 1, 2, 3]),
         (3 * 6 + 4, 6, 2, [3, 4]),
+        # Powers of two:
+        (0b101_110, 2, 7, [0, 1, 0, 1, 1, 1, 0]),
+        (5 * 64**2 + 63 * 64 + 7, 64, 3, [5, 63, 7]),
+        (8**5 - 1, 8, 5, [7, 7, 7, 7, 7]),
     ],
 )
 def test_value_to_digits(value, base, length, expected):
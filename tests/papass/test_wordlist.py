@@ -85,6 +85,15 @@ class TestInterface:
         wordlist_from_file = WordList.from_file(file_path)
         assert wordlist_from_file == wordlist
 
+    @pytest.mark.parametrize("char", ["\x0b", "\x0c", "\x1c", "\x1e", "\x85", "\u2028", "\u2029"])
+    def test_from_file_splits_on_newlines_only(self, tmp_path, char):
+        file_path = tmp_path / "test.wordlist"
+
+        with open(file_path, "w") as fin:
+            fin.write(f"ab{char}cd\nij\r\nkl\n")
+
+        assert WordList.from_file(file_path) == WordList([f"ab{char}cd", "ij", "kl"])
+
     def test_to_file(self, tmp_path, words, wordlist):
         file_path = tmp_path / "test.wordlist"
 
@@ -94,6 +103,19 @@ class TestInterface:
         assert wordlist_2 == wordlist
         assert wordlist_2 == WordList(words)
 
+    @pytest.mark.parametrize("char", list("abcde"))
+    def test_contains_char(self, wordlist, char):
+        assert wordlist.contains_char(char)
+
+    @pytest.mark.parametrize("char", list("fz \n"))
+    def test_not_contains_char(self, wordlist, char):
+        assert not wordlist.contains_char(char)
+
+    def test_contains_newline(self, wordlist):
+        """Newlines separate the words internally but may occur in words too."""
+        assert not wordlist.contains_char("\n")
+        assert (wordlist + ["a\nb"]).contains_char("\n")
+
 
 class TestWordSize:
     @pytest.fixture